@@ -3,6 +3,8 @@ import numpy as np
 import os
 import time
 
+from .pose_tuning import DEFAULT_MODEL_COMPLEXITY, create_pose
+
 # Suppress TensorFlow/MediaPipe logs
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
 
@@ -13,15 +15,31 @@ class BaseAnalyzer:
     Handles:
       - Required joint visibility check
       - 5-second countdown before reps start
+
+    Subclasses describe their rep logic with the class attributes below so
+    the live state machine and the offline batch scorer share thresholds.
     """
-    def __init__(self, required_landmarks=None):
+    ANGLE_JOINTS = ()             # (a, b, c) landmark triplets, in analyze_form() argument order
+    REP_ANGLE = 0                 # Index into ANGLE_JOINTS that drives rep counting
+    REP_DOWN_BELOW = None         # Stage goes "down" once the rep angle drops below this
+    REP_UP_ABOVE = None           # Rep counts once the rep angle rises back above this
+    START_STAGE = "up"
+    IDEAL_RANGES = ()             # (min, max) ideal angle per ANGLE_JOINTS entry
+    RATE_TOLERANCE = 10           # Degrees per rating step outside the ideal range
+    SCORE_WEIGHTS = ()            # Weight of each joint rating in the form score
+    MIN_SCORE = 1                 # Floor applied to each frame's form score
+    MIN_VISIBILITY = 0.6          # Joint visibility needed before the countdown
+    START_POSE_JOINTS = None      # Optional (a, b, c) triplet checked before the countdown
+    START_POSE_RANGE = None       # Exclusive (low, high) bounds for the start pose angle
+    START_POSE_HOLD_FRAMES = 10   # Start pose must be held for more than this many frames
+    START_POSE_SETTLE_FRAMES = 0  # Frames between the hold being met and the countdown starting
+
+    def __init__(self, required_landmarks=None, model_complexity=DEFAULT_MODEL_COMPLEXITY):
         # MediaPipe setup
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_pose = mp.solutions.pose
-        self.pose = self.mp_pose.Pose(
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
+        self.model_complexity = model_complexity
+        self._pose = None
 
         # Rep + score tracking
         self.rep_count = 0
@@ -36,6 +54,13 @@ class BaseAnalyzer:
         self.countdown_start_time = None # When countdown begins
         self.countdown_seconds = 3       # Countdown length
 
+    @property
+    def pose(self):
+        """Pose graph built on first use; the server and batch paths run their own."""
+        if self._pose is None:
+            self._pose = create_pose(self.model_complexity)
+        return self._pose
+
     # ----------------------------------------------------
     # Landmark helper
     # ----------------------------------------------------
@@ -51,7 +76,7 @@ class BaseAnalyzer:
             for lm_id in self.required_landmarks:
                 lm = landmarks[lm_id]
                 # Require 0.6 visibility or better
-                if lm.visibility < 0.6:
+                if lm.visibility < self.MIN_VISIBILITY:
                     return False
             return True
         except:
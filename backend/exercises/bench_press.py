@@ -11,13 +11,29 @@ L_WRIST = mp.solutions.pose.PoseLandmark.LEFT_WRIST.value
 
 class BenchPressAnalyzer(BaseAnalyzer):
 
-    def __init__(self):
+    ANGLE_JOINTS = (
+        (L_ELBOW, L_SHOULDER, L_HIP),   # Shoulder
+        (L_SHOULDER, L_ELBOW, L_WRIST), # Elbow
+        (L_ELBOW, L_WRIST, L_HIP),      # Wrist
+    )
+    REP_ANGLE = 0
+    REP_DOWN_BELOW = 60
+    REP_UP_ABOVE = 90
+    START_STAGE = "up"
+    IDEAL_RANGES = ((40, 80), (130, 150), (160, 200))
+    RATE_TOLERANCE = 10
+    SCORE_WEIGHTS = (0.45, 0.40, 0.15)
+    MIN_VISIBILITY = 0.0  # Landmarks only need to exist
+    START_POSE_JOINTS = (L_SHOULDER, L_ELBOW, L_WRIST)
+    START_POSE_RANGE = (130, 170)
+
+    def __init__(self, **kwargs):
         super().__init__(required_landmarks=[
             L_HIP, L_SHOULDER, L_ELBOW, L_WRIST
-        ])
+        ], **kwargs)
 
         # Rep logic
-        self.stage = "up"
+        self.stage = self.START_STAGE
 
         # Readiness/Countdown system
         self.ready = False
@@ -46,8 +62,9 @@ class BenchPressAnalyzer(BaseAnalyzer):
 
             elbow_angle = calculate_angle(shoulder, elbow, wrist)
 
-            # Bar at top position = elbows extended (130°–160°)
-            return 130 < elbow_angle < 170
+            # Bar at top position = elbows extended (130°–170°)
+            low, high = self.START_POSE_RANGE
+            return low < elbow_angle < high
         except:
             return False
 
@@ -69,7 +86,10 @@ class BenchPressAnalyzer(BaseAnalyzer):
     # ---------------------------------------------------------
     #   FORM SCORING
     # ---------------------------------------------------------
-    def rate_angle(self, angle, ideal_min, ideal_max, tolerance=10):
+    def rate_angle(self, angle, ideal_min, ideal_max, tolerance=None):
+        if tolerance is None:
+            tolerance = self.RATE_TOLERANCE
+
         if ideal_min <= angle <= ideal_max:
             return 5
         elif abs(angle - ideal_min) <= tolerance or abs(angle - ideal_max) <= tolerance:
@@ -84,9 +104,9 @@ class BenchPressAnalyzer(BaseAnalyzer):
     def analyze_form(self, shoulder_angle, elbow_angle, wrist_angle):
         issues = []
 
-        shoulder_score = self.rate_angle(shoulder_angle, 40, 80)
-        elbow_score = self.rate_angle(elbow_angle, 130, 150)
-        wrist_score = self.rate_angle(wrist_angle, 160, 200)
+        shoulder_score = self.rate_angle(shoulder_angle, *self.IDEAL_RANGES[0])
+        elbow_score = self.rate_angle(elbow_angle, *self.IDEAL_RANGES[1])
+        wrist_score = self.rate_angle(wrist_angle, *self.IDEAL_RANGES[2])
 
         # Feedback
         if shoulder_score < 5:
@@ -107,7 +127,8 @@ class BenchPressAnalyzer(BaseAnalyzer):
             elif wrist_angle > 200:
                 issues.append("Avoid overextending wrist backward.")
 
-        weighted = (shoulder_score * 0.45) + (elbow_score * 0.40) + (wrist_score * 0.15)
+        w_shoulder, w_elbow, w_wrist = self.SCORE_WEIGHTS
+        weighted = (shoulder_score * w_shoulder) + (elbow_score * w_elbow) + (wrist_score * w_wrist)
         return round(weighted, 2), issues
 
     # ---------------------------------------------------------
@@ -127,7 +148,7 @@ class BenchPressAnalyzer(BaseAnalyzer):
             if self._starting_position_ok(landmarks):
                 self.start_pose_frames += 1
 
-                if self.start_pose_frames > 10:
+                if self.start_pose_frames > self.START_POSE_HOLD_FRAMES:
                     self.start_pose_ready = True
                 else:
                     return 0, ["Hold your starting top position..."], None
@@ -159,9 +180,9 @@ class BenchPressAnalyzer(BaseAnalyzer):
             self.form_issues.extend(fb)
 
             # Rep detection
-            if shoulder_angle < 60 and self.stage == "up":
+            if shoulder_angle < self.REP_DOWN_BELOW and self.stage == "up":
                 self.stage = "down"
-            elif shoulder_angle > 90 and self.stage == "down":
+            elif shoulder_angle > self.REP_UP_ABOVE and self.stage == "down":
                 self.stage = "up"
                 stage_changed = "rep"
                 return current_score, self.form_issues, stage_changed
@@ -0,0 +1,200 @@
+"""
+Offline (recorded clip) analysis.
+
+Instead of stepping each analyzer's process_frame() state machine with
+wall-clock countdowns, the whole joint-angle series is computed once and
+reps are segmented and scored with array operations. The countdown becomes
+a video-time offset, so results only depend on the clip itself.
+
+Reps are found with the analyzer's own REP_DOWN_BELOW / REP_UP_ABOVE
+thresholds. Every frame is rated with the analyzer's IDEAL_RANGES,
+RATE_TOLERANCE and SCORE_WEIGHTS, and a rep's score is the mean of those
+frame scores over its whole window (from the stage turning "down" to the
+frame the rep completes). The live process_frame() instead reports the score of the
+single frame where the rep completes, so the two scores use the same
+ratings but generally differ for the same clip. Feedback for a rep comes
+from analyze_form() at its worst-scoring frame.
+"""
+import numpy as np
+
+from .utils import calculate_angles, rate_angles
+
+NUM_LANDMARKS = 33
+
+
+# ----------------------------------------------------
+# Landmark series
+# ----------------------------------------------------
+def landmarks_to_array(landmarks):
+    """Returns a (33, 3) array of [x, y, visibility]; all NaN when no pose was found."""
+    if not landmarks:
+        return np.full((NUM_LANDMARKS, 3), np.nan, dtype=np.float32)
+    return np.array([[lm.x, lm.y, lm.visibility] for lm in landmarks], dtype=np.float32)
+
+
+def extract_landmark_series(frames, tracker):
+    """
+    Runs Pose once over a clip.
+
+    Args:
+        frames (iterable): BGR frames.
+        tracker: A PoseROITracker (or anything with a process() returning Pose results).
+
+    Returns:
+        np.ndarray: Landmarks of shape (N, 33, 3).
+    """
+    series = []
+    for frame in frames:
+        results = tracker.process(frame)
+        series.append(landmarks_to_array(results.pose_landmarks.landmark if results.pose_landmarks else None))
+    if not series:
+        return np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32)
+    return np.stack(series)
+
+
+def joint_angle_series(landmarks, joints):
+    """Angles for every (a, b, c) landmark triplet, shape (N, len(joints))."""
+    xy = landmarks[..., :2]
+    return np.stack([calculate_angles(xy[:, a], xy[:, b], xy[:, c]) for a, b, c in joints], axis=1)
+
+
+# ----------------------------------------------------
+# Segmentation
+# ----------------------------------------------------
+def _run_lengths(mask):
+    """Length of the current run of True values at every index."""
+    counts = np.cumsum(mask)
+    return counts - np.maximum.accumulate(np.where(mask, 0, counts))
+
+
+def segment_reps(angle, down_below, up_above, start_stage="up"):
+    """
+    Vectorized version of the analyzers' up/down stage machine.
+
+    Returns:
+        (rep_frames, down_frames): Indices where a rep completes and where the stage turns "down".
+    """
+    marks = np.where(angle < down_below, -1, np.where(angle > up_above, 1, 0))
+    initial = 1 if start_stage == "up" else -1
+
+    # The stage only changes when a threshold is crossed, so it is the last non-zero mark
+    last = np.maximum.accumulate(np.where(marks != 0, np.arange(len(marks)), -1))
+    stage = np.where(last >= 0, marks[last], initial)
+    previous = np.concatenate(([initial], stage[:-1]))
+
+    rep_frames = np.flatnonzero((previous == -1) & (stage == 1))
+    down_frames = np.flatnonzero((previous == 1) & (stage == -1))
+    return rep_frames, down_frames
+
+
+def _rep_windows(rep_frames, down_frames):
+    """Each rep spans from the "down" turn before it up to and including its completion frame."""
+    before = np.searchsorted(down_frames, rep_frames, side="right")
+    starts = np.concatenate(([0], down_frames))[before]
+    return starts, rep_frames + 1
+
+
+# ----------------------------------------------------
+# Scoring
+# ----------------------------------------------------
+def frame_scores(analyzer, angles):
+    """Weighted form score of every frame, the vectorized counterpart of analyze_form()."""
+    ratings = np.stack([
+        rate_angles(angles[:, i], ideal_min, ideal_max, analyzer.RATE_TOLERANCE)
+        for i, (ideal_min, ideal_max) in enumerate(analyzer.IDEAL_RANGES)
+    ], axis=1)
+    weights = np.asarray(analyzer.SCORE_WEIGHTS, dtype=float)
+    return np.maximum(ratings @ weights / weights.sum(), analyzer.MIN_SCORE)
+
+
+def _score_windows(scores, rep_angle, starts, ends):
+    """Per-rep mean score, worst frame and range of motion, without a Python loop."""
+    lengths = ends - starts
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    frames = np.arange(lengths.sum()) + np.repeat(starts - offsets, lengths)  # Window frames, concatenated
+    window_scores, window_angles = scores[frames], rep_angle[frames]
+
+    means = np.add.reduceat(window_scores, offsets) / lengths
+    window_ids = np.repeat(np.arange(len(starts)), lengths)
+    worst = frames[np.lexsort((window_scores, window_ids))[offsets]]
+
+    return means, worst, np.minimum.reduceat(window_angles, offsets), np.maximum.reduceat(window_angles, offsets)
+
+
+def _analysis_start(analyzer, landmarks, times):
+    """Index of the first frame after readiness + countdown, or None if the lifter never got ready."""
+    if analyzer.START_POSE_JOINTS is not None:
+        low, high = analyzer.START_POSE_RANGE
+        angle = joint_angle_series(landmarks, [analyzer.START_POSE_JOINTS])[:, 0]
+        ready = _run_lengths((angle > low) & (angle < high)) > analyzer.START_POSE_HOLD_FRAMES
+    else:
+        visibility = landmarks[:, analyzer.required_landmarks, 2]
+        ready = np.all(visibility >= analyzer.MIN_VISIBILITY, axis=1)
+
+    # Live analyzers may only start the countdown a few frames after the hold is met
+    countdown_from = int(np.argmax(ready)) + analyzer.START_POSE_SETTLE_FRAMES
+    if not ready.any() or countdown_from >= len(times):
+        return None
+
+    # Countdown as a video-time offset; the frame that ends it only shows "Start!"
+    ready_at = times[countdown_from]
+    return int(np.searchsorted(times, ready_at + analyzer.countdown_seconds, side="left")) + 1
+
+
+# ----------------------------------------------------
+# Main entry point
+# ----------------------------------------------------
+def analyze_landmark_series(analyzer, landmarks, fps=30.0, timestamps=None):
+    """
+    Counts and scores every rep of a recorded clip in one pass.
+
+    Args:
+        analyzer (BaseAnalyzer): Supplies thresholds, joints and analyze_form().
+        landmarks (array-like): (N, 33, 3) series from extract_landmark_series().
+        fps (float): Clip frame rate, used when timestamps are not given.
+        timestamps (array-like): Optional per-frame video time in seconds.
+
+    Returns:
+        dict: reps, avg_score, analysis_start_time and per-rep details.
+    """
+    landmarks = np.asarray(landmarks, dtype=float)
+    times = np.asarray(timestamps, dtype=float) if timestamps is not None else np.arange(len(landmarks)) / fps
+    result = {"reps": 0, "avg_score": 0, "analysis_start_time": None, "rep_details": []}
+
+    # Frames without a pose never reach the analyzers in the live loop either
+    detected = ~np.isnan(landmarks[:, 0, 0]) if len(landmarks) else np.zeros(0, dtype=bool)
+    landmarks, times = landmarks[detected], times[detected]
+    if not len(landmarks):
+        return result
+
+    start = _analysis_start(analyzer, landmarks, times)
+    if start is None or start >= len(landmarks):
+        return result
+    landmarks, times = landmarks[start:], times[start:]
+    result["analysis_start_time"] = round(float(times[0]), 3)
+
+    angles = joint_angle_series(landmarks, analyzer.ANGLE_JOINTS)
+    rep_angle = angles[:, analyzer.REP_ANGLE]
+    rep_frames, down_frames = segment_reps(
+        rep_angle, analyzer.REP_DOWN_BELOW, analyzer.REP_UP_ABOVE, analyzer.START_STAGE
+    )
+    if not len(rep_frames):
+        return result
+
+    starts, ends = _rep_windows(rep_frames, down_frames)
+    means, worst, low, high = _score_windows(frame_scores(analyzer, angles), rep_angle, starts, ends)
+
+    # Only the feedback text is built per rep
+    for i, frame in enumerate(worst):
+        result["rep_details"].append({
+            "start_time": round(float(times[starts[i]]), 3),
+            "end_time": round(float(times[rep_frames[i]]), 3),
+            "worst_time": round(float(times[frame]), 3),
+            "score": round(float(means[i]), 2),
+            "issues": analyzer.analyze_form(*angles[frame])[1],
+            "range_of_motion": [round(float(low[i]), 1), round(float(high[i]), 1)],
+        })
+
+    result["reps"] = len(means)
+    result["avg_score"] = round(float(means.mean()), 2)
+    return result
@@ -13,14 +13,32 @@ L_EAR = mp.solutions.pose.PoseLandmark.LEFT_EAR.value
 
 class OverheadPressAnalyzer(BaseAnalyzer):
 
-    def __init__(self):
+    ANGLE_JOINTS = (
+        (L_ELBOW, L_SHOULDER, L_HIP),   # Shoulder
+        (L_SHOULDER, L_ELBOW, L_WRIST), # Elbow
+        (L_SHOULDER, L_EAR, L_HIP),     # Neck
+    )
+    REP_ANGLE = 0
+    REP_DOWN_BELOW = 140
+    REP_UP_ABOVE = 165
+    START_STAGE = "down"
+    IDEAL_RANGES = ((160, 180), (170, 180), (170, 180))
+    RATE_TOLERANCE = 10
+    SCORE_WEIGHTS = (0.5, 0.3, 0.2)
+    MIN_VISIBILITY = 0.0  # Landmarks only need to exist
+    START_POSE_JOINTS = (L_ELBOW, L_SHOULDER, L_HIP)
+    START_POSE_RANGE = (float("-inf"), 140)
+    START_POSE_SETTLE_FRAMES = 1  # The frame that completes the hold still returns early
+
+    def __init__(self, **kwargs):
         super().__init__(
             required_landmarks=[
                 L_HIP, L_SHOULDER, L_ELBOW, L_WRIST, L_EAR
-            ]
+            ],
+            **kwargs
         )
 
-        self.stage = "down"
+        self.stage = self.START_STAGE
 
         # Readiness system
         self.ready = False
@@ -50,7 +68,8 @@ class OverheadPressAnalyzer(BaseAnalyzer):
             elbow = self.get_landmark_coords(landmarks, L_ELBOW)
 
             shoulder_angle = calculate_angle(elbow, shoulder, hip)
-            return shoulder_angle < 140  # Bar at shoulder height
+            low, high = self.START_POSE_RANGE
+            return low < shoulder_angle < high  # Bar at shoulder height
         except:
             return False
 
@@ -73,7 +92,10 @@ class OverheadPressAnalyzer(BaseAnalyzer):
     # ---------------------------------------------------------
     #   FORM ANALYSIS (unchanged)
     # ---------------------------------------------------------
-    def rate_angle(self, angle, ideal_min, ideal_max, tolerance=10):
+    def rate_angle(self, angle, ideal_min, ideal_max, tolerance=None):
+        if tolerance is None:
+            tolerance = self.RATE_TOLERANCE
+
         if ideal_min <= angle <= ideal_max:
             return 5
         elif abs(angle - ideal_min) <= tolerance or abs(angle - ideal_max) <= tolerance:
@@ -88,9 +110,9 @@ class OverheadPressAnalyzer(BaseAnalyzer):
     def analyze_form(self, s_angle, e_angle, n_angle):
         issues = []
 
-        shoulder_score = self.rate_angle(s_angle, 160, 180)
-        elbow_score = self.rate_angle(e_angle, 170, 180)
-        neck_score = self.rate_angle(n_angle, 170, 180)
+        shoulder_score = self.rate_angle(s_angle, *self.IDEAL_RANGES[0])
+        elbow_score = self.rate_angle(e_angle, *self.IDEAL_RANGES[1])
+        neck_score = self.rate_angle(n_angle, *self.IDEAL_RANGES[2])
 
         if shoulder_score < 5:
             issues.append("Improve shoulder flexion; press fully overhead.")
@@ -101,10 +123,11 @@ class OverheadPressAnalyzer(BaseAnalyzer):
         if neck_score < 5:
             issues.append("Keep head neutral; avoid forward head posture.")
 
+        w_shoulder, w_elbow, w_neck = self.SCORE_WEIGHTS
         final_score = round(
-            (0.5 * shoulder_score) +
-            (0.3 * elbow_score) +
-            (0.2 * neck_score), 1
+            (w_shoulder * shoulder_score) +
+            (w_elbow * elbow_score) +
+            (w_neck * neck_score), 1
         )
 
         return final_score, issues
@@ -125,7 +148,7 @@ class OverheadPressAnalyzer(BaseAnalyzer):
         if not self.start_pose_ready:
             if self._starting_position_ok(landmarks):
                 self.start_pose_frames += 1
-                if self.start_pose_frames > 10:  # ~0.5 seconds
+                if self.start_pose_frames > self.START_POSE_HOLD_FRAMES:  # ~0.5 seconds
                     self.start_pose_ready = True
                 return 0, ["Hold your starting position..."], None
             else:
@@ -157,10 +180,10 @@ class OverheadPressAnalyzer(BaseAnalyzer):
             self.form_issues.extend(feedback)
 
             # REP DETECTION
-            if s_angle < 140 and self.stage == "up":
+            if s_angle < self.REP_DOWN_BELOW and self.stage == "up":
                 self.stage = "down"
 
-            elif s_angle > 165 and self.stage == "down":
+            elif s_angle > self.REP_UP_ABOVE and self.stage == "down":
                 self.stage = "up"
                 stage_changed = "rep"
                 return score_to_report, self.form_issues, stage_changed
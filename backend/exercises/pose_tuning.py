@@ -0,0 +1,170 @@
+import time
+import mediapipe as mp
+
+# MediaPipe Pose variants, most accurate first: 2 = heavy, 1 = full, 0 = lite
+MODEL_COMPLEXITIES = (2, 1, 0)
+DEFAULT_MODEL_COMPLEXITY = 1
+DEFAULT_TARGET_FPS = 15
+
+# Benchmark results per (frame shape, budget) so each host only pays once
+_selection_cache = {}
+
+
+def create_pose(model_complexity=DEFAULT_MODEL_COMPLEXITY, **pose_kwargs):
+    """Builds a MediaPipe Pose with the detection settings used across the app."""
+    pose_kwargs.setdefault("min_detection_confidence", 0.5)
+    pose_kwargs.setdefault("min_tracking_confidence", 0.5)
+    return mp.solutions.pose.Pose(model_complexity=model_complexity, **pose_kwargs)
+
+
+def frame_budget(target_fps=None, latency_ms=None):
+    """
+    Converts a target FPS or a per-frame latency budget into seconds per frame.
+    A latency budget wins when both are given.
+    """
+    if latency_ms:
+        return float(latency_ms) / 1000.0
+    return 1.0 / float(target_fps or DEFAULT_TARGET_FPS)
+
+
+def benchmark_model_complexity(frames, model_complexity, warmup=2):
+    """
+    Runs one Pose variant over sample RGB frames.
+
+    Returns:
+        float: Mean seconds per frame, excluding the warmup frames.
+    """
+    with create_pose(model_complexity) as pose:
+        for frame in frames[:warmup]:
+            pose.process(frame)
+
+        timed = frames[warmup:] or frames
+        start = time.perf_counter()
+        for frame in timed:
+            pose.process(frame)
+        return (time.perf_counter() - start) / len(timed)
+
+
+def select_model_complexity(frames, target_fps=None, latency_ms=None):
+    """
+    Picks the most accurate Pose variant whose mean latency fits the budget.
+    Variants that fail to load are skipped; falls back to the lightest one that
+    loaded when nothing fits.
+
+    Args:
+        frames (list): Sample RGB frames from the session's input source.
+    """
+    if not frames:
+        return DEFAULT_MODEL_COMPLEXITY
+
+    budget = frame_budget(target_fps, latency_ms)
+    key = (frames[0].shape, round(budget, 4))
+    if key in _selection_cache:
+        return _selection_cache[key]
+
+    # The full model ships with mediapipe, so it is the fallback when nothing else loads
+    selected = DEFAULT_MODEL_COMPLEXITY
+    for complexity in MODEL_COMPLEXITIES:
+        try:
+            latency = benchmark_model_complexity(frames, complexity)
+        except Exception as e:
+            # e.g. the lite/heavy model can't be downloaded on an offline or read-only host
+            print(f"Pose complexity {complexity} unavailable: {e}")
+            continue
+        print(f"Pose complexity {complexity}: {latency * 1000:.1f} ms/frame")
+        selected = complexity  # Lightest variant that loaded so far
+        if latency <= budget:
+            break
+
+    _selection_cache[key] = selected
+    return selected
+
+
+class AdaptivePose:
+    """
+    Drop-in replacement for a MediaPipe Pose that steps down to a lighter
+    model when frames keep falling behind the latency budget.
+
+    The first `warmup` frames after construction, reset() and every step-down
+    are left out of the average, since they include graph start-up and a fresh
+    person detection. Graphs made with sibling() step down together.
+    """
+    def __init__(self, model_complexity=DEFAULT_MODEL_COMPLEXITY, target_fps=None,
+                 latency_ms=None, window=30, slack=1.2, warmup=10, **pose_kwargs):
+        self.model_complexity = model_complexity
+        self.budget = frame_budget(target_fps, latency_ms)
+        self.window = window      # Frames averaged before deciding
+        self.slack = slack        # Tolerated overshoot of the budget
+        self.warmup = warmup      # Frames skipped before timing starts
+        self.pose_kwargs = pose_kwargs
+        self.pose = create_pose(model_complexity, **pose_kwargs)
+        self.model_complexity_floor = 0   # Raised when a lighter model fails to load
+        self._group = [self]
+        self._restart_window()
+
+    def sibling(self, **pose_kwargs):
+        """Another graph on the same budget, e.g. for a second image region, that steps down with this one."""
+        other = AdaptivePose(self.model_complexity, latency_ms=self.budget * 1000, window=self.window,
+                             slack=self.slack, warmup=self.warmup, **{**self.pose_kwargs, **pose_kwargs})
+        other.model_complexity_floor = self.model_complexity_floor
+        other._group = self._group
+        self._group.append(other)
+        return other
+
+    def process(self, image):
+        start = time.perf_counter()
+        results = self.pose.process(image)
+        if self._warmup_left:
+            self._warmup_left -= 1
+            return results
+
+        self._elapsed += time.perf_counter() - start
+        self._frames += 1
+        if self._frames >= self.window:
+            mean_latency = self._elapsed / self._frames
+            self._elapsed, self._frames = 0.0, 0
+            self._maybe_step_down(mean_latency)
+
+        return results
+
+    def _maybe_step_down(self, mean_latency):
+        if mean_latency <= self.budget * self.slack or self.model_complexity <= self.model_complexity_floor:
+            return
+
+        complexity = self.model_complexity - 1
+        lighter = []
+        try:
+            for member in self._group:
+                lighter.append(create_pose(complexity, **member.pose_kwargs))
+        except Exception as e:
+            print(f"Pose complexity {complexity} unavailable: {e}")
+            for pose in lighter:
+                pose.close()
+            for member in self._group:
+                member.model_complexity_floor = self.model_complexity
+            return
+
+        print(f"Pose falling behind ({mean_latency * 1000:.1f} ms/frame), "
+              f"stepping down to complexity {complexity}")
+        for member, pose in zip(self._group, lighter):
+            member.pose.close()
+            member.pose = pose
+            member.model_complexity = complexity
+            member._restart_window()
+
+    def _restart_window(self):
+        self._elapsed, self._frames = 0.0, 0
+        self._warmup_left = self.warmup
+
+    def reset(self):
+        self.pose.reset()
+        self._restart_window()
+
+    def close(self):
+        self.pose.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
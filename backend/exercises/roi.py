@@ -0,0 +1,107 @@
+import cv2
+
+
+class PoseROITracker:
+    """
+    Runs Pose on a padded crop around the lifter instead of the whole frame.
+
+    Two tracking-mode Pose graphs are used, so neither ever has to be reset:
+    one only sees the full frame and finds the lifter, the other only sees the
+    crop. The crop stays put while the lifter's visible landmarks stay inside
+    it, so the crop graph keeps tracking the same image region. When they
+    reach a crop edge the crop is re-centered from those same landmarks, and
+    only when the lifter is lost does the frame go back to the full-frame
+    graph. Crops that would cover most of the frame are skipped, since they
+    save nothing over running on the frame itself.
+    """
+    def __init__(self, pose, full_frame_pose, padding=0.3, edge_margin=0.03, min_crop=96,
+                 max_crop_area=0.25, min_visibility=0.5):
+        self.pose = pose                        # Tracking-mode Pose, only ever sees the crop
+        self.full_frame_pose = full_frame_pose  # Tracking-mode Pose, only ever sees the full frame
+        self.padding = padding                  # Extra margin around the landmark box, per side
+        self.edge_margin = edge_margin          # Crop-normalized distance that counts as touching the edge
+        self.min_crop = min_crop                # Smallest crop side in pixels
+        self.max_crop_area = max_crop_area      # Largest crop, as a fraction of the frame area
+        self.min_visibility = min_visibility    # Landmarks below this don't count for the edge test
+        self.roi = None                         # (x0, y0, x1, y1) in frame pixels
+        self.full_frame_runs = 0
+        self.recrops = 0
+
+    @property
+    def model_complexity(self):
+        return getattr(self.pose, "model_complexity", None)
+
+    # ----------------------------------------------------
+    # Main entry point: takes a BGR frame, returns Pose results in frame coordinates
+    # ----------------------------------------------------
+    def process(self, frame):
+        h, w = frame.shape[:2]
+
+        if self.roi is not None:
+            x0, y0, x1, y1 = self.roi
+            results = self.pose.process(cv2.cvtColor(frame[y0:y1, x0:x1], cv2.COLOR_BGR2RGB))
+            if results.pose_landmarks:
+                touches_edge = self._touches_edge(results.pose_landmarks, w, h)
+                self._to_frame_coords(results.pose_landmarks, w, h)
+                if touches_edge:
+                    # Re-center on this frame's landmarks; no extra inference needed
+                    self.recrops += 1
+                    self.roi = self._roi_from_landmarks(results.pose_landmarks, w, h)
+                return results
+            self.roi = None
+
+        # No crop yet, lifter lost, or crop not worth it → the full-frame graph
+        self.full_frame_runs += 1
+        results = self.full_frame_pose.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        self.roi = self._roi_from_landmarks(results.pose_landmarks, w, h)
+        return results
+
+    def reset(self):
+        self.roi = None
+
+    # ----------------------------------------------------
+    # Helpers
+    # ----------------------------------------------------
+    def _touches_edge(self, pose_landmarks, w, h):
+        """True when a visible landmark reaches a crop side that isn't also the frame border."""
+        x0, y0, x1, y1 = self.roi
+        low, high = self.edge_margin, 1 - self.edge_margin
+        for lm in pose_landmarks.landmark:
+            if lm.visibility < self.min_visibility:
+                continue
+            if (lm.x < low and x0 > 0) or (lm.x > high and x1 < w):
+                return True
+            if (lm.y < low and y0 > 0) or (lm.y > high and y1 < h):
+                return True
+        return False
+
+    def _to_frame_coords(self, pose_landmarks, w, h):
+        """Maps crop-normalized landmarks back to full-frame normalized coordinates."""
+        x0, y0, x1, y1 = self.roi
+        crop_w, crop_h = x1 - x0, y1 - y0
+        for lm in pose_landmarks.landmark:
+            lm.x = (x0 + lm.x * crop_w) / w
+            lm.y = (y0 + lm.y * crop_h) / h
+            lm.z = lm.z * crop_w / w
+
+    def _roi_from_landmarks(self, pose_landmarks, w, h):
+        if not pose_landmarks:
+            return None
+
+        # All landmarks, not just confident ones, so occluded limbs stay inside the crop
+        xs = [lm.x * w for lm in pose_landmarks.landmark]
+        ys = [lm.y * h for lm in pose_landmarks.landmark]
+        box_w = max(max(xs) - min(xs), self.min_crop)
+        box_h = max(max(ys) - min(ys), self.min_crop)
+        pad_x, pad_y = box_w * self.padding, box_h * self.padding
+
+        x0 = max(int(min(xs) - pad_x), 0)
+        y0 = max(int(min(ys) - pad_y), 0)
+        x1 = min(int(max(xs) + pad_x), w)
+        y1 = min(int(max(ys) + pad_y), h)
+
+        if x1 - x0 < self.min_crop or y1 - y0 < self.min_crop:
+            return None
+        if (x1 - x0) * (y1 - y0) > self.max_crop_area * w * h:
+            return None
+        return x0, y0, x1, y1
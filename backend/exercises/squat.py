@@ -12,13 +12,30 @@ class SquatAnalyzer(BaseAnalyzer):
     """
     Expert-based Squat analyzer with countdown and readiness.
     """
-    def __init__(self):
+    ANGLE_JOINTS = (
+        (L_SHOULDER, L_HIP, L_KNEE),     # Hip
+        (L_HIP, L_KNEE, L_ANKLE),        # Knee
+        (L_KNEE, L_ANKLE, L_FOOT_INDEX), # Ankle
+    )
+    REP_ANGLE = 1
+    REP_DOWN_BELOW = 140
+    REP_UP_ABOVE = 170
+    START_STAGE = "up"
+    IDEAL_RANGES = ((130, 160), (100, 140), (80, 110))
+    RATE_TOLERANCE = 20
+    SCORE_WEIGHTS = (5, 5, 4)
+    MIN_SCORE = 2
+
+    def __init__(self, **kwargs):
         super().__init__(required_landmarks=[
             L_SHOULDER, L_HIP, L_KNEE, L_ANKLE, L_FOOT_INDEX
-        ])
-        self.stage = "up"
+        ], **kwargs)
+        self.stage = self.START_STAGE
+
+    def rate_angle(self, angle, ideal_min, ideal_max, tolerance=None):
+        if tolerance is None:
+            tolerance = self.RATE_TOLERANCE
 
-    def rate_angle(self, angle, ideal_min, ideal_max, tolerance=20):
         if ideal_min <= angle <= ideal_max:
             return 5
         elif abs(angle - ideal_min) <= tolerance or abs(angle - ideal_max) <= tolerance:
@@ -33,9 +50,9 @@ class SquatAnalyzer(BaseAnalyzer):
     def analyze_form(self, hip_angle, knee_angle, ankle_angle):
         issues = []
 
-        hip_score = self.rate_angle(hip_angle, 130, 160)
-        knee_score = self.rate_angle(knee_angle, 100, 140)
-        ankle_score = self.rate_angle(ankle_angle, 80, 110)
+        hip_score = self.rate_angle(hip_angle, *self.IDEAL_RANGES[0])
+        knee_score = self.rate_angle(knee_angle, *self.IDEAL_RANGES[1])
+        ankle_score = self.rate_angle(ankle_angle, *self.IDEAL_RANGES[2])
 
         if hip_score < 5:
             if hip_angle < 130:
@@ -53,12 +70,13 @@ class SquatAnalyzer(BaseAnalyzer):
             elif ankle_angle > 110:
                 issues.append("Too much dorsiflexion — adjust stance width.")
 
+        w_hip, w_knee, w_ankle = self.SCORE_WEIGHTS
         final_score = round(
-            (hip_score * 5 + knee_score * 5 + ankle_score * 4) / 14, 2
+            (hip_score * w_hip + knee_score * w_knee + ankle_score * w_ankle) / sum(self.SCORE_WEIGHTS), 2
         )
 
-        if final_score < 2:
-            final_score = 2
+        if final_score < self.MIN_SCORE:
+            final_score = self.MIN_SCORE
 
         return final_score, issues
 
@@ -102,10 +120,10 @@ class SquatAnalyzer(BaseAnalyzer):
             )
             self.form_issues.extend(feedback)
 
-            if knee_angle < 140 and self.stage == "up":
+            if knee_angle < self.REP_DOWN_BELOW and self.stage == "up":
                 self.stage = "down"
 
-            if knee_angle > 170 and self.stage == "down":
+            if knee_angle > self.REP_UP_ABOVE and self.stage == "down":
                 self.stage = "up"
                 stage_changed = "rep"
                 return current_score, self.form_issues, stage_changed
@@ -0,0 +1,85 @@
+"""
+Synthetic side-view landmark trajectories with known rep counts.
+
+Used by the load generator and the offline-vs-live tests; frames are lists
+of MediaPipe-like landmarks with x, y, z and visibility.
+"""
+import math
+from collections import namedtuple
+
+from . import bench_press, overhead_press, squat
+
+# Angle the rep state machine watches: (start/top angle, bottom/turn angle)
+REP_ANGLES = {
+    "Squat": (175, 100),          # Knee angle
+    "Bench Press": (100, 45),     # Shoulder angle
+    "Overhead Press": (100, 175), # Shoulder angle
+}
+
+NUM_LANDMARKS = 33
+
+Landmark = namedtuple("Landmark", ["x", "y", "z", "visibility"])
+
+
+def _offset(origin, direction_deg, length):
+    rad = math.radians(direction_deg)
+    return origin[0] + length * math.cos(rad), origin[1] + length * math.sin(rad)
+
+
+def _landmark_frame(points):
+    landmarks = [Landmark(0.0, 0.0, 0.0, 0.0)] * NUM_LANDMARKS
+    for lm_id, (x, y) in points.items():
+        landmarks[lm_id] = Landmark(x, y, 0.0, 1.0)
+    return landmarks
+
+
+def synthetic_pose(workout, angle):
+    """Builds a side-view skeleton whose rep-driving joint sits at `angle` degrees."""
+    if workout == "Squat":
+        knee = (0.5, 0.7)
+        hip = _offset(knee, -90, 0.2)
+        ankle = _offset(knee, -90 + angle, 0.2)
+        return _landmark_frame({
+            squat.L_SHOULDER: _offset(hip, -90, 0.25),
+            squat.L_HIP: hip,
+            squat.L_KNEE: knee,
+            squat.L_ANKLE: ankle,
+            squat.L_FOOT_INDEX: (ankle[0] + 0.08, ankle[1]),
+        })
+
+    if workout == "Bench Press":
+        shoulder = (0.5, 0.5)
+        elbow = _offset(shoulder, angle, 0.15)
+        return _landmark_frame({
+            bench_press.L_HIP: _offset(shoulder, 0, 0.3),
+            bench_press.L_SHOULDER: shoulder,
+            bench_press.L_ELBOW: elbow,
+            bench_press.L_WRIST: _offset(elbow, angle - 30, 0.15),  # Elbow held at 150°
+        })
+
+    shoulder = (0.5, 0.4)
+    elbow = _offset(shoulder, 90 - angle, 0.15)
+    return _landmark_frame({
+        overhead_press.L_HIP: _offset(shoulder, 90, 0.3),
+        overhead_press.L_SHOULDER: shoulder,
+        overhead_press.L_ELBOW: elbow,
+        overhead_press.L_WRIST: _offset(elbow, 90 - angle, 0.15),
+        overhead_press.L_EAR: _offset(shoulder, -100, 0.1),
+    })
+
+
+def synthetic_rep(workout, frames_per_rep):
+    """One full rep: start angle -> turning angle -> start angle, eased with a cosine."""
+    start, turn = REP_ANGLES[workout]
+    for i in range(frames_per_rep):
+        phase = (1 - math.cos(2 * math.pi * i / frames_per_rep)) / 2
+        yield synthetic_pose(workout, start + (turn - start) * phase)
+    yield synthetic_pose(workout, start)
+
+
+def synthetic_session(workout, reps, frames_per_rep=60, hold_frames=150):
+    """Holds the start pose for `hold_frames` (readiness + countdown), then performs `reps` reps."""
+    frames = [synthetic_pose(workout, REP_ANGLES[workout][0])] * hold_frames
+    for _ in range(reps):
+        frames.extend(synthetic_rep(workout, frames_per_rep))
+    return frames
@@ -24,4 +24,41 @@ def calculate_angle(a, b, c):
     if angle > 180.0:
         angle = 360 - angle
 
-    return angle
\ No newline at end of file
+    return angle
+
+def calculate_angles(a, b, c):
+    """
+    Vectorized calculate_angle() for whole time series of points.
+
+    Args:
+        a, b, c (array-like): Arrays of shape (N, 2) holding [x, y] per frame, B being the vertex.
+
+    Returns:
+        np.ndarray: Angles in degrees (0 to 180), shape (N,).
+    """
+    a, b, c = np.asarray(a, dtype=float), np.asarray(b, dtype=float), np.asarray(c, dtype=float)
+
+    radians = (np.arctan2(c[..., 1] - b[..., 1], c[..., 0] - b[..., 0])
+               - np.arctan2(a[..., 1] - b[..., 1], a[..., 0] - b[..., 0]))
+    angles = np.abs(radians * 180.0 / np.pi)
+
+    return np.where(angles > 180.0, 360 - angles, angles)
+
+
+def rate_angles(angles, ideal_min, ideal_max, tolerance):
+    """
+    Vectorized version of the analyzers' rate_angle(): 5 inside the ideal range,
+    then one point less per `tolerance` degrees outside it, down to 1.
+
+    Returns:
+        np.ndarray: Integer ratings (1 to 5), same shape as `angles`.
+    """
+    angles = np.asarray(angles, dtype=float)
+    distance = np.minimum(np.abs(angles - ideal_min), np.abs(angles - ideal_max))
+    inside = (angles >= ideal_min) & (angles <= ideal_max)
+
+    return np.select(
+        [inside, distance <= tolerance, distance <= 2 * tolerance, distance <= 3 * tolerance],
+        [5, 4, 3, 2],
+        default=1,
+    )
@@ -0,0 +1,223 @@
+"""
+Streaming, memory-bounded video upload ingest.
+
+The request body is read in fixed-size chunks and written straight to a
+temp file, so memory use does not grow with the clip. A single PyAV
+decoder on a worker thread reads that file through UploadStream, whose
+reads block until the requested bytes have been written. The decoder
+therefore never sees a partly written sample and every frame is decoded
+exactly once, whatever the upload timing. Fragmented / faststart MP4 and
+WebM decode while uploading; for MP4s with the index at the end the
+demuxer's seek to the end simply waits for the upload to finish.
+
+Both a raw body (e.g. chunked transfer encoding with a video/* content
+type) and multipart/form-data are accepted. Multipart text fields that
+come before the file part are available before decoding starts.
+"""
+import io
+import os
+import tempfile
+import threading
+
+import av
+from werkzeug.sansio.multipart import Data, Epilogue, Field, File, MultipartDecoder, NeedData
+
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_MB", "512")) * 1024 * 1024
+MAX_FIELD_BYTES = 64 * 1024
+CHUNK_SIZE = 64 * 1024
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+class StreamingUpload:
+    """Copies a request body stream into a temp file, enforcing a size limit."""
+    def __init__(self, stream, mimetype, boundary=None, max_bytes=MAX_UPLOAD_BYTES, suffix=".mp4"):
+        self.stream = stream
+        self.max_bytes = max_bytes
+        self.decoder = None
+        if mimetype == "multipart/form-data" and boundary:
+            # Text fields are capped in _drain_multipart; werkzeug's own limit counts its parse buffer
+            self.decoder = MultipartDecoder(boundary.encode(), max_form_memory_size=None)
+        self.fields = {}
+        self._part = None         # Name of the multipart part being read; "file" for the video
+        self._field_data = None
+        self._has_file = False
+        self.bytes_written = 0
+        self.error = None
+
+        self.started = threading.Event()  # Video bytes have begun arriving
+        self.done = threading.Event()     # Upload finished (or failed)
+        self.cancelled = threading.Event()  # Analysis failed; the rest of the body is not needed
+        self._grew = threading.Condition()
+
+        fd, self.path = tempfile.mkstemp(suffix=suffix)
+        self._file = os.fdopen(fd, "wb")
+
+    # ----------------------------------------------------
+    # Receiving (runs on the request thread)
+    # ----------------------------------------------------
+    def receive(self):
+        try:
+            while not self.cancelled.is_set():
+                chunk = self.stream.read(CHUNK_SIZE)
+                if self.decoder is None:
+                    if not chunk: break
+                    self._write(chunk)
+                else:
+                    self.decoder.receive_data(chunk or None)
+                    self._drain_multipart()
+                    if not chunk: break
+        except Exception as e:
+            self.error = e
+        finally:
+            self._file.close()
+            self.started.set()
+            self.done.set()
+            with self._grew:
+                self._grew.notify_all()
+
+        if self.error:
+            raise self.error
+
+    def cancel(self):
+        """Stops receive() after its current chunk."""
+        self.cancelled.set()
+
+    def _drain_multipart(self):
+        event = self.decoder.next_event()
+        while not isinstance(event, (NeedData, Epilogue)):
+            if isinstance(event, File):
+                # Only the first file part is the clip
+                self._part = None if self._has_file else "file"
+                self._has_file = True
+                self._field_data = None
+            elif isinstance(event, Field):
+                self._part = event.name
+                self._field_data = bytearray()
+            elif isinstance(event, Data):
+                if self._part == "file":
+                    self._write(event.data)
+                elif self._field_data is not None:
+                    self._field_data += event.data
+                    if len(self._field_data) > MAX_FIELD_BYTES:
+                        raise UploadTooLarge(f"Form field '{self._part}' exceeds {MAX_FIELD_BYTES // 1024} KB limit")
+                    if not event.more_data:
+                        self.fields[self._part] = self._field_data.decode()
+                        self._field_data = None
+            event = self.decoder.next_event()
+
+    def _write(self, data):
+        if not data:
+            return
+        self.bytes_written += len(data)
+        if self.bytes_written > self.max_bytes:
+            raise UploadTooLarge(f"Upload exceeds {self.max_bytes // (1024 * 1024)} MB limit")
+
+        self._file.write(data)
+        self._file.flush()
+        self.started.set()
+        with self._grew:
+            self._grew.notify_all()
+
+    # ----------------------------------------------------
+    # Helpers for the decoding thread
+    # ----------------------------------------------------
+    def wait_for_bytes(self, size):
+        """Blocks until `size` bytes are on disk or the upload ended."""
+        with self._grew:
+            self._grew.wait_for(lambda: self.done.is_set() or self.bytes_written >= size)
+
+    def cleanup(self):
+        if not self._file.closed:
+            self._file.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class UploadStream(io.RawIOBase):
+    """Read-only view of the upload's temp file whose reads wait for the bytes to arrive."""
+    def __init__(self, upload):
+        self.upload = upload
+        self._file = open(upload.path, "rb")
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        self.upload.wait_for_bytes(self._file.tell() + len(buffer))
+        if self.upload.error:
+            return 0
+        return self._file.readinto(buffer)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_END:
+            self.upload.done.wait()   # The size is only known once the upload is complete
+        return self._file.seek(offset, whence)
+
+    def tell(self):
+        return self._file.tell()
+
+    def close(self):
+        self._file.close()
+        super().close()
+
+
+class GrowingVideoReader:
+    """
+    Yields BGR frames from an upload that may still be in progress.
+    Frames are never buffered; each one is handed on as soon as it is decoded.
+    """
+    def __init__(self, upload):
+        self.upload = upload
+        self.fps = 30.0
+        self.timestamps = []   # Presentation time of every yielded frame, in seconds
+
+    def __iter__(self):
+        self.upload.started.wait()
+        if self.upload.error:
+            return
+
+        with UploadStream(self.upload) as source, av.open(source, mode="r") as container:
+            stream = container.streams.video[0]
+            stream.thread_type = "AUTO"
+            if stream.average_rate:
+                self.fps = float(stream.average_rate)
+
+            for frame in container.decode(stream):
+                self.timestamps.append(frame.time if frame.time is not None else len(self.timestamps) / self.fps)
+                yield frame.to_ndarray(format="bgr24")
+
+
+def analyze_upload(upload, analyze_frames):
+    """
+    Receives the upload on the calling (request) thread while analyze_frames(upload)
+    decodes and analyzes it on a worker thread.
+
+    Returns:
+        The value returned by analyze_frames().
+    """
+    outcome = {}
+
+    def worker():
+        try:
+            outcome["result"] = analyze_frames(upload)
+        except Exception as e:
+            outcome["error"] = e
+            upload.cancel()   # e.g. bad input or an undecodable clip: don't copy the rest to disk
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    try:
+        upload.receive()
+    finally:
+        thread.join()
+        upload.cleanup()
+
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
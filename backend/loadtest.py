@@ -0,0 +1,296 @@
+"""
+Local load generator for the BiomechFit backend.
+
+Spawns N simulated lifters in parallel. Each one either replays a synthetic
+landmark trajectory with a known rep count through the exercise analyzer, or
+uploads one of the bundled exercise videos to /api/analyze_video, then asks
+the recommendation endpoint for the next session. Everything runs in-process
+through Flask's test client, so no network, camera or display is needed.
+
+The synthetic source skips Pose inference and only measures the analyzer and
+endpoint path; use --source video to measure full per-lifter capacity.
+Rep counts are checked against the known count for every client.
+
+Usage:
+    python loadtest.py --clients 8 --workout Squat --reps 5
+    python loadtest.py --clients 4 --source video --workout "Bench Press"
+"""
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from server import ANALYZERS, BASE_DIR, app
+from exercises.pose_tuning import DEFAULT_MODEL_COMPLEXITY
+from exercises.synthetic import REP_ANGLES, synthetic_pose, synthetic_rep
+
+VIDEOS = {
+    "Squat": BASE_DIR.parent / "frontend/assets/images/squat.mp4",
+    "Bench Press": BASE_DIR.parent / "frontend/assets/images/benchpress.mp4",
+    "Overhead Press": BASE_DIR.parent / "frontend/assets/images/overheadpress.mp4",
+}
+
+# Reps /api/analyze_video reports for each bundled clip with the default Pose model.
+# These are reference outputs, not hand counts: jitter around the rep thresholds adds
+# extra short "reps", so a change here means the analysis pipeline changed.
+VIDEO_REPS = {"Squat": 4, "Bench Press": 13, "Overhead Press": 10}
+
+MONITOR_INTERVAL = 0.05  # Seconds between thread-count samples
+
+
+def video_frame_count(path):
+    import cv2
+
+    cap = cv2.VideoCapture(str(path))
+    try:
+        return int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    finally:
+        cap.release()
+
+
+# ----------------------------------------------------
+# Simulated client
+# ----------------------------------------------------
+class ClientResult:
+    def __init__(self):
+        self.frame_latencies = []
+        self.analysis_latencies = []   # /api/analyze_video, end to end
+        self.request_latencies = []
+        self.reps = 0
+        self.frames = 0
+        self.errors = []
+        self.measure_start = None   # perf_counter() once the countdown is over
+        self.measure_end = None
+        self.cpu_start = None       # Process CPU seconds at the same two moments
+        self.cpu_end = None
+
+    def start_measuring(self):
+        self.measure_start, self.cpu_start = time.perf_counter(), time.process_time()
+
+    def stop_measuring(self):
+        self.measure_end, self.cpu_end = time.perf_counter(), time.process_time()
+
+
+def analyze_video(client_id, args, user, result):
+    """Uploads the workout's bundled clip to /api/analyze_video; returns the set's average score."""
+    path = VIDEOS[args.workout]
+    form = {
+        "workout": args.workout,
+        "user": json.dumps(user),
+        "pose": json.dumps({"model_complexity": args.model_complexity}),
+    }
+    with app.test_client() as client, open(path, "rb") as video:
+        start = time.perf_counter()
+        response = client.post("/api/analyze_video", data={**form, "file": (video, path.name)},
+                               content_type="multipart/form-data")
+        result.analysis_latencies.append(time.perf_counter() - start)
+
+    if response.status_code != 200:
+        result.errors.append(f"client {client_id}: /api/analyze_video returned {response.status_code}")
+        return 0
+
+    body = response.get_json()
+    result.reps = body["reps"]
+    result.frames = video_frame_count(path)
+    expected = VIDEO_REPS[args.workout] if args.model_complexity == DEFAULT_MODEL_COMPLEXITY else None
+    if expected is not None and result.reps != expected:
+        result.errors.append(f"client {client_id}: counted {result.reps} reps, expected {expected}")
+    return body["avg_score"]
+
+
+def replay_synthetic(client_id, args, result):
+    """Feeds a synthetic set through the analyzer frame by frame; returns the set's average score."""
+    analyzer = ANALYZERS[args.workout]()
+    scores = []
+    frame_interval = 1.0 / args.fps if args.fps else 0.0
+
+    # The analyzers' countdown runs on wall-clock time, so hold the start pose until it
+    # ends; these frames are only waiting and are left out of the stats
+    hold = synthetic_pose(args.workout, REP_ANGLES[args.workout][0])
+    while not analyzer.countdown_done:
+        analyzer.process_frame(hold)
+        time.sleep(frame_interval or 1 / 30)
+
+    result.start_measuring()
+    for _ in range(args.reps):
+        for landmarks in synthetic_rep(args.workout, args.frames_per_rep):
+            start = time.perf_counter()
+            score, issues, stage_changed = analyzer.process_frame(landmarks)
+            result.frame_latencies.append(time.perf_counter() - start)
+            result.frames += 1
+            if stage_changed == "rep":
+                result.reps += 1
+                scores.append(score)
+            if frame_interval: time.sleep(frame_interval)
+
+    if result.reps != args.reps:
+        result.errors.append(f"client {client_id}: counted {result.reps} reps, expected {args.reps}")
+    return round(sum(scores) / len(scores), 2) if scores else 0
+
+
+def run_client(client_id, args, user):
+    result = ClientResult()
+    avg_score = 0
+    try:
+        if args.source == "synthetic":
+            avg_score = replay_synthetic(client_id, args, result)
+        else:
+            result.start_measuring()
+            avg_score = analyze_video(client_id, args, user, result)
+    except Exception as e:
+        result.errors.append(f"client {client_id}: analysis failed: {e}")
+
+    payload = {"workout": args.workout, "user": user, "avg_score": avg_score}
+    with app.test_client() as client:
+        for _ in range(args.requests):
+            start = time.perf_counter()
+            try:
+                response = client.post("/api/recommend", json=payload)
+                if response.status_code != 200:
+                    result.errors.append(f"client {client_id}: /api/recommend returned {response.status_code}")
+            except Exception as e:
+                result.errors.append(f"client {client_id}: /api/recommend failed: {e}")
+            result.request_latencies.append(time.perf_counter() - start)
+
+    result.stop_measuring()
+    return result
+
+
+# ----------------------------------------------------
+# Reporting
+# ----------------------------------------------------
+class ThreadMonitor:
+    """Samples the thread count on a background thread while the load runs."""
+    def __init__(self, interval=MONITOR_INTERVAL):
+        self.interval = interval
+        self.peak_threads = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            # Not counting the monitor itself
+            self.peak_threads = max(self.peak_threads, threading.active_count() - 1)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stop.set()
+        self._thread.join()
+
+
+def _max_rss_mb():
+    if resource is None:
+        return None
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)  # KiB on Linux
+
+
+def _latency_summary(latencies):
+    if not latencies:
+        return {}
+    ms = np.asarray(latencies) * 1000
+    return {
+        "mean_ms": round(float(ms.mean()), 3),
+        "p50_ms": round(float(np.percentile(ms, 50)), 3),
+        "p95_ms": round(float(np.percentile(ms, 95)), 3),
+        "p99_ms": round(float(np.percentile(ms, 99)), 3),
+        "max_ms": round(float(ms.max()), 3),
+    }
+
+
+def run_load_test(args):
+    user = {"age": 30, "height": 175, "weight": 75, "sex": "M",
+            "load": 60, "sets": 3, "reps": args.reps}
+
+    start = time.perf_counter()
+    with ThreadMonitor() as monitor, ThreadPoolExecutor(max_workers=args.clients) as pool:
+        futures = [pool.submit(run_client, i, args, user) for i in range(args.clients)]
+        results = [f.result() for f in futures]
+    wall = time.perf_counter() - start
+
+    # Throughput and CPU use are both taken over the window where clients were doing measured work
+    measured = [r for r in results if r.measure_start is not None and r.measure_end is not None]
+    if measured:
+        first = min(measured, key=lambda r: r.measure_start)
+        last = max(measured, key=lambda r: r.measure_end)
+        window, cpu = last.measure_end - first.measure_start, last.cpu_end - first.cpu_start
+    else:
+        window, cpu = wall, 0.0
+    window = window or wall
+
+    frames = sum(r.frames for r in results)
+    requests = sum(len(r.request_latencies) + len(r.analysis_latencies) for r in results)
+    errors = [e for r in results for e in r.errors]
+    if args.source == "video":
+        counts = sorted({r.reps for r in results if not r.errors})
+        if len(counts) > 1:
+            errors.append(f"clients counted different reps for the same clip: {counts}")
+
+    report = {
+        "clients": args.clients,
+        "workout": args.workout,
+        "source": args.source,
+        "pipeline": ("analyzer only (no Pose inference)" if args.source == "synthetic"
+                     else "/api/analyze_video: upload, decode, Pose and analysis"),
+        "wall_seconds": round(wall, 3),
+        "measured_seconds": round(window, 3),
+        "frames": frames,
+        "frames_per_second": round(frames / window, 1),
+        "requests": requests,
+        "requests_per_second": round(requests / window, 1),
+        "reps_counted": sum(r.reps for r in results),
+        "frame_latency": _latency_summary([l for r in results for l in r.frame_latencies]),
+        "analysis_latency": _latency_summary([l for r in results for l in r.analysis_latencies]),
+        "request_latency": _latency_summary([l for r in results for l in r.request_latencies]),
+        "errors": len(errors),
+        "error_rate": round(len(errors) / max(args.clients + requests, 1), 4),
+        "resources": {
+            "cpu_seconds": round(cpu, 2),
+            "cpu_utilization": round(cpu / window, 2),  # 1.0 == one core busy
+            "peak_threads": monitor.peak_threads,
+            "max_rss_mb": _max_rss_mb(),
+        },
+    }
+    return report, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate concurrent lifters against one backend node.")
+    parser.add_argument("--clients", type=int, default=4, help="Concurrent simulated lifters")
+    parser.add_argument("--workout", choices=list(ANALYZERS), default="Squat")
+    parser.add_argument("--source", choices=["synthetic", "video"], default="synthetic")
+    parser.add_argument("--reps", type=int, default=5, help="Reps per synthetic set")
+    parser.add_argument("--frames-per-rep", type=int, default=60)
+    parser.add_argument("--fps", type=float, default=0, help="Pace synthetic frames like a camera; 0 = as fast as possible")
+    parser.add_argument("--requests", type=int, default=1, help="Recommendation calls per client")
+    parser.add_argument("--model-complexity", type=int, choices=[0, 1, 2], default=DEFAULT_MODEL_COMPLEXITY,
+                        help="Pose model for --source video; 1 ships with mediapipe, 0 and 2 are downloaded. "
+                             "Rep counts are only checked against VIDEO_REPS with the default model")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report, errors = run_load_test(args)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for key, value in report.items():
+            print(f"{key:>20}: {value}")
+        for error in errors[:20]:
+            print(f"  ! {error}")
+
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -5,6 +5,8 @@ import cv2
 import mediapipe as mp
 import pickle
 import os
+import json
+import itertools
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -38,6 +40,15 @@ CORS(app)
 from exercises.bench_press import BenchPressAnalyzer
 from exercises.overhead_press import OverheadPressAnalyzer
 from exercises.squat import SquatAnalyzer
+from exercises.roi import PoseROITracker
+from exercises.offline import analyze_landmark_series, extract_landmark_series
+from ingest import MAX_UPLOAD_BYTES, GrowingVideoReader, StreamingUpload, UploadTooLarge, analyze_upload
+from exercises.pose_tuning import (
+    DEFAULT_MODEL_COMPLEXITY, DEFAULT_TARGET_FPS, AdaptivePose, create_pose, select_model_complexity
+)
+
+ANALYZERS = {"Squat": SquatAnalyzer, "Bench Press": BenchPressAnalyzer, "Overhead Press": OverheadPressAnalyzer}
+POSE_BENCHMARK_FRAMES = 8
 
 def get_screen_resolution():
     """Return the desktop size only when the local camera workflow runs."""
@@ -48,6 +59,70 @@ def get_screen_resolution():
     root.destroy()
     return width, height
 
+def fit_frame(frame, width, height):
+    """Mirrors the camera frame and zooms it slightly to hide side gaps."""
+    frame = cv2.flip(frame, 1)
+    h, w, _ = frame.shape
+    crop_w = int(w * 0.12) # Slight crop to fill width
+    frame = frame[:, crop_w:w-crop_w]
+    return cv2.resize(frame, (width, height))
+
+def parse_pose_options(options):
+    """Reads the session's Pose settings; model_complexity may be 0, 1, 2 or "auto"."""
+    complexity = options.get("model_complexity", DEFAULT_MODEL_COMPLEXITY)
+    if complexity != "auto":
+        complexity = int(complexity)
+        if complexity not in (0, 1, 2):
+            raise ValueError("model_complexity must be 0, 1, 2 or 'auto'")
+    target_fps = float(options.get("target_fps", DEFAULT_TARGET_FPS))
+    latency_ms = options.get("latency_ms")
+    latency_ms = float(latency_ms) if latency_ms is not None else None
+    for name, value in (("target_fps", target_fps), ("latency_ms", latency_ms)):
+        # Also rejects NaN and infinity, which would make the frame budget meaningless
+        if value is not None and not 0 < value < float("inf"):
+            raise ValueError(f"{name} must be a positive number")
+    return complexity, target_fps, latency_ms
+
+def parse_session(data):
+    """Parses the workout and user profile fields shared by every endpoint."""
+    workout = data.get("workout", "Squat")
+    user = data.get("user", {})
+    age = int(user.get("age", 0))
+    height = float(user.get("height", 0))
+    weight = float(user.get("weight", 0))
+    sex_map = {"M": 0, "Male": 0, "F": 1, "Female": 1}
+    sex_int = sex_map.get(user.get("sex"), 0)
+    workout_map = {"Squat": 0, "Bench Press": 1, "Overhead Press": 2}
+    workout_num = workout_map.get(workout, 0)
+    load, sets, reps = float(user.get("load", 0)), int(user.get("sets", 0)), int(user.get("reps", 0))
+    return workout, workout_num, sex_int, age, height, weight, load, sets, reps
+
+def parse_upload_fields(fields):
+    """Parses a video upload's workout, user (JSON) and pose (JSON) fields; raises ValueError on bad input."""
+    try:
+        workout = fields.get("workout", "Squat")
+        if workout not in ANALYZERS:
+            raise ValueError(f"Unknown workout '{workout}'")
+        session = parse_session({"workout": workout, "user": json.loads(fields.get("user", "{}"))})
+        pose_options = parse_pose_options(json.loads(fields.get("pose", "{}")))
+    except Exception as e:
+        raise ValueError(str(e)) from e
+    return session, pose_options
+
+@app.route("/recommend", methods=["POST"])
+@app.route("/api/recommend", methods=["POST"])
+def recommend():
+    """Returns the next-session recommendation for an already scored set."""
+    data = request.json or {}
+    try:
+        workout, workout_num, sex_int, age, height, weight, load, sets, reps = parse_session(data)
+        avg_score = float(data.get("avg_score", 0))
+    except Exception as e:
+        return jsonify({"error": f"Input error: {str(e)}"}), 400
+
+    prediction = get_recommendation(workout_num, sex_int, age, height, weight, load, sets, reps, round(avg_score))
+    return jsonify({"workout": workout, "avg_score": avg_score, "recommendation": prediction})
+
 @app.route("/analyze", methods=["POST"])
 @app.route("/api/analyze", methods=["POST"])
 def analyze():
@@ -58,24 +133,13 @@ def analyze():
         }), 501
 
     data = request.json
-    workout = data.get("workout", "Squat")
-    user = data.get("user", {})
 
     # Data Parsing
     try:
-        age = int(user.get("age", 0))
-        height = float(user.get("height", 0))
-        weight = float(user.get("weight", 0))
-        sex_map = {"M": 0, "Male": 0, "F": 1, "Female": 1}
-        sex_int = sex_map.get(user.get("sex"), 0)
-        workout_map = {"Squat": 0, "Bench Press": 1, "Overhead Press": 2}
-        workout_num = workout_map.get(workout, 0)
-        load, sets, reps = float(user.get("load", 0)), int(user.get("sets", 0)), int(user.get("reps", 0))
+        workout, workout_num, sex_int, age, height, weight, load, sets, reps = parse_session(data)
+        model_complexity, target_fps, latency_ms = parse_pose_options(data.get("pose", {}))
     except Exception as e:
         return jsonify({"error": f"Input error: {str(e)}"}), 400
-
-    analyzers = {"Squat": SquatAnalyzer, "Bench Press": BenchPressAnalyzer, "Overhead Press": OverheadPressAnalyzer}
-    analyzer = analyzers[workout]()
     
     cap = cv2.VideoCapture(0)
     cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
@@ -83,6 +147,18 @@ def analyze():
 
     # Window configuration to cover side gaps but keep title bar
     SCREEN_W, SCREEN_H = get_screen_resolution()
+
+    # Benchmark the Pose variants on live frames and keep the best one that fits the budget
+    if model_complexity == "auto":
+        samples = []
+        for _ in range(POSE_BENCHMARK_FRAMES):
+            success, frame = cap.read()
+            if not success: break
+            samples.append(cv2.cvtColor(fit_frame(frame, SCREEN_W, SCREEN_H - 100), cv2.COLOR_BGR2RGB))
+        model_complexity = select_model_complexity(samples, target_fps, latency_ms) if samples else DEFAULT_MODEL_COMPLEXITY
+
+    analyzer = ANALYZERS[workout](model_complexity=model_complexity)
+
     window_name = "BIOMECHFIT_ULTRA_v3.0"
     cv2.namedWindow(window_name, cv2.WINDOW_NORMAL) 
     cv2.resizeWindow(window_name, SCREEN_W, SCREEN_H - 100) 
@@ -91,18 +167,16 @@ def analyze():
     rep_count, form_scores, ticker_pos = 0, [], 0
     mp_pose, mp_drawing = mp.solutions.pose, mp.solutions.drawing_utils
 
-    with mp_pose.Pose(min_detection_confidence=0.5, min_tracking_confidence=0.5) as pose:
+    # Both graphs share the budget and step down together
+    with AdaptivePose(model_complexity, target_fps=target_fps, latency_ms=latency_ms) as pose, \
+            pose.sibling() as full_frame_pose:
+        tracker = PoseROITracker(pose, full_frame_pose)
         while cap.isOpened():
             success, frame = cap.read()
             if not success: break
 
-            frame = cv2.flip(frame, 1)
-            
             # --- ZOOM LOGIC TO HIDE GAPS ---
-            h, w, _ = frame.shape
-            crop_w = int(w * 0.12) # Slight crop to fill width
-            frame = frame[:, crop_w:w-crop_w]
-            frame = cv2.resize(frame, (SCREEN_W, SCREEN_H - 100))
+            frame = fit_frame(frame, SCREEN_W, SCREEN_H - 100)
             h, w, _ = frame.shape
             
             # HUD Overlay
@@ -111,7 +185,7 @@ def analyze():
             cv2.rectangle(overlay, (0, h-90), (w, h), (12, 12, 12), -1)
             cv2.addWeighted(overlay, 0.65, frame, 0.35, 0, frame)
 
-            results = pose.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+            results = tracker.process(frame)
 
             if results.pose_landmarks:
                 mp_drawing.draw_landmarks(frame, results.pose_landmarks, mp_pose.POSE_CONNECTIONS,
@@ -158,7 +232,63 @@ def analyze():
         "workout": workout, 
         "reps": rep_count, 
         "avg_score": avg_score, 
-        "recommendation": prediction
+        "recommendation": prediction,
+        "pose_model_complexity": pose.model_complexity
+    })
+
+@app.route("/analyze_video", methods=["POST"])
+@app.route("/api/analyze_video", methods=["POST"])
+def analyze_video():
+    """
+    Analyzes a recorded clip while it uploads.
+
+    The body is either the raw video (any non-multipart content type, chunked is fine)
+    or multipart/form-data with a file part. "workout", "user" (JSON) and "pose" (JSON)
+    come from the query string or from form fields sent before the file.
+    """
+    if request.content_length and request.content_length > MAX_UPLOAD_BYTES:
+        return jsonify({"error": f"Upload exceeds {MAX_UPLOAD_BYTES // (1024 * 1024)} MB limit"}), 413
+
+    upload = StreamingUpload(request.stream, request.mimetype, request.mimetype_params.get("boundary"))
+    upload.fields.update(request.args.to_dict())
+
+    def analyze_frames(upload):
+        # Fields sent before the file are in by now, so bad input fails before any decoding
+        upload.started.wait()
+        session, (model_complexity, target_fps, latency_ms) = parse_upload_fields(upload.fields)
+        reader = GrowingVideoReader(upload)
+        frames = iter(reader)
+
+        # Benchmark on the clip's first frames, then feed them back in front of the rest
+        if model_complexity == "auto":
+            samples = list(itertools.islice(frames, POSE_BENCHMARK_FRAMES))
+            rgb = [cv2.cvtColor(frame, cv2.COLOR_BGR2RGB) for frame in samples]
+            model_complexity = select_model_complexity(rgb, target_fps, latency_ms) if rgb else DEFAULT_MODEL_COMPLEXITY
+            frames = itertools.chain(samples, frames)
+
+        # A fixed model, unlike the live loop's AdaptivePose, so results don't depend on host load
+        analyzer = ANALYZERS[session[0]](model_complexity=model_complexity)
+        with create_pose(model_complexity) as pose, create_pose(model_complexity) as full_frame_pose:
+            landmarks = extract_landmark_series(frames, PoseROITracker(pose, full_frame_pose))
+        result = analyze_landmark_series(analyzer, landmarks, fps=reader.fps, timestamps=reader.timestamps)
+        return session, result, model_complexity
+
+    try:
+        session, result, pose_model_complexity = analyze_upload(upload, analyze_frames)
+    except UploadTooLarge as e:
+        return jsonify({"error": str(e)}), 413
+    except (KeyError, ValueError) as e:
+        return jsonify({"error": f"Input error: {str(e)}"}), 400
+
+    workout, workout_num, sex_int, age, height, weight, load, sets, reps = session
+    prediction = get_recommendation(workout_num, sex_int, age, height, weight, load, sets, reps, round(result["avg_score"]))
+    return jsonify({
+        "workout": workout,
+        "reps": result["reps"],
+        "avg_score": result["avg_score"],
+        "rep_details": result["rep_details"],
+        "recommendation": prediction,
+        "pose_model_complexity": pose_model_complexity
     })
 
 if __name__ == '__main__':
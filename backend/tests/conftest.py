@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Tests import modules the same way server.py does, relative to backend/
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
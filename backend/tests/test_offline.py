@@ -0,0 +1,151 @@
+import math
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from exercises.offline import _analysis_start, _rep_windows, analyze_landmark_series, landmarks_to_array, segment_reps
+from exercises.utils import calculate_angle, calculate_angles
+
+# Power-of-two frame rate keeps timestamps exact, so wall-clock and video-time countdowns agree
+FPS = 32
+
+
+def test_calculate_angles_matches_scalar():
+    rng = np.random.default_rng(0)
+    a, b, c = rng.random((3, 50, 2))
+
+    expected = [calculate_angle(a[i], b[i], c[i]) for i in range(50)]
+    np.testing.assert_allclose(calculate_angles(a, b, c), expected)
+
+
+def test_segment_reps_uses_hysteresis():
+    angle = np.array([175, 150, 130, 150, 175, 160, 130, 165, 175])
+
+    rep_frames, down_frames = segment_reps(angle, 140, 170, "up")
+
+    assert rep_frames.tolist() == [4, 8]
+    assert down_frames.tolist() == [2, 6]
+
+
+def test_segment_reps_starting_down_counts_first_press():
+    angle = np.array([100, 150, 170, 130, 170])
+
+    rep_frames, down_frames = segment_reps(angle, 140, 165, "down")
+
+    assert rep_frames.tolist() == [2, 4]
+    assert down_frames.tolist() == [3]
+
+
+def test_rep_windows_end_at_rep_completion():
+    rep_frames, down_frames = np.array([30, 70, 110]), np.array([10, 50, 90, 150])
+
+    starts, ends = _rep_windows(rep_frames, down_frames)
+
+    # A later "down" turn with no completed rep (e.g. racking the bar) stays out of the last window
+    assert starts.tolist() == [10, 50, 90]
+    assert ends.tolist() == [31, 71, 111]
+
+
+def _start_pose_analyzer(settle_frames):
+    return SimpleNamespace(
+        START_POSE_JOINTS=(0, 1, 2),
+        START_POSE_RANGE=(float("-inf"), 140),
+        START_POSE_HOLD_FRAMES=10,
+        START_POSE_SETTLE_FRAMES=settle_frames,
+        countdown_seconds=3,
+    )
+
+
+def _start_pose_series(length, angle):
+    landmarks = np.zeros((length, 3, 3))
+    landmarks[:, 0, :2] = (1, 0)
+    landmarks[:, 2, :2] = (math.cos(math.radians(angle)), math.sin(math.radians(angle)))
+    return landmarks
+
+
+@pytest.mark.parametrize("settle_frames, expected", [(0, 107), (1, 108)])
+def test_analysis_start_offsets_countdown_in_video_time(settle_frames, expected):
+    times = np.arange(200) / FPS
+
+    start = _analysis_start(_start_pose_analyzer(settle_frames), _start_pose_series(200, 90), times)
+
+    # Hold met on frame 10, countdown from 10 + settle, "Start!" frame 96 frames later
+    assert start == expected
+
+
+def test_analysis_start_without_ready_pose():
+    times = np.arange(200) / FPS
+
+    # Arms straight (180°) never satisfy the < 140° start pose
+    assert _analysis_start(_start_pose_analyzer(0), _start_pose_series(200, 180), times) is None
+
+
+# ----------------------------------------------------
+# Offline results against the live analyzers
+# ----------------------------------------------------
+def _analyzer_class(workout):
+    pytest.importorskip("mediapipe")
+    from exercises.bench_press import BenchPressAnalyzer
+    from exercises.overhead_press import OverheadPressAnalyzer
+    from exercises.squat import SquatAnalyzer
+
+    return {"Squat": SquatAnalyzer, "Bench Press": BenchPressAnalyzer, "Overhead Press": OverheadPressAnalyzer}[workout]
+
+
+@pytest.mark.parametrize("workout", ["Squat", "Bench Press", "Overhead Press"])
+def test_offline_matches_live_process_frame(workout, monkeypatch):
+    analyzer_cls = _analyzer_class(workout)
+    from exercises.synthetic import synthetic_session
+
+    frames = synthetic_session(workout, reps=4, frames_per_rep=40, hold_frames=4 * FPS)
+    clock = {"now": 0.0}
+    monkeypatch.setattr(time, "time", lambda: clock["now"])
+
+    analyzer = analyzer_cls()
+    live_reps, live_start = [], None
+    for i, landmarks in enumerate(frames):
+        clock["now"] = i / FPS
+        _, _, stage_changed = analyzer.process_frame(landmarks)
+        if stage_changed == "rep":
+            live_reps.append(i)
+        if live_start is None and analyzer.countdown_done:
+            live_start = i + 1
+
+    series = np.stack([landmarks_to_array(landmarks) for landmarks in frames])
+    offline = analyze_landmark_series(analyzer_cls(), series, fps=FPS)
+
+    assert len(live_reps) == 4
+    assert offline["reps"] == len(live_reps)
+    assert offline["analysis_start_time"] == round(live_start / FPS, 3)
+    assert [round(rep["end_time"] * FPS) for rep in offline["rep_details"]] == live_reps
+
+
+def test_trailing_idle_frames_stay_out_of_the_last_rep():
+    analyzer_cls = _analyzer_class("Squat")
+    from exercises.synthetic import synthetic_pose, synthetic_session
+
+    frames = synthetic_session("Squat", reps=3, frames_per_rep=40, hold_frames=4 * FPS)
+    # Walking away after the set: knee bent to 120°, below the "down" threshold and badly rated
+    series = np.stack([landmarks_to_array(landmarks) for landmarks in frames + [synthetic_pose("Squat", 120)] * 300])
+
+    details = analyze_landmark_series(analyzer_cls(), series, fps=FPS)["rep_details"]
+
+    assert len(details) == 3
+    assert len({round((rep["end_time"] - rep["start_time"]) * FPS) for rep in details}) == 1
+    assert details[-1]["score"] == details[0]["score"]
+    assert details[-1]["range_of_motion"] == details[0]["range_of_motion"]
+    assert details[-1]["worst_time"] <= details[-1]["end_time"]
+
+
+@pytest.mark.parametrize("workout", ["Squat", "Bench Press", "Overhead Press"])
+def test_frame_scores_match_analyze_form(workout):
+    analyzer = _analyzer_class(workout)()
+    from exercises.offline import frame_scores
+
+    angles = np.random.default_rng(1).uniform(0, 200, size=(300, 3))
+
+    expected = [analyzer.analyze_form(*row)[0] for row in angles]
+    # analyze_form() rounds to 1-2 decimals; frame_scores() does not
+    np.testing.assert_allclose(frame_scores(analyzer, angles), expected, atol=0.05 + 1e-9)
@@ -0,0 +1,82 @@
+import pytest
+
+pytest.importorskip("mediapipe")
+from exercises import pose_tuning
+from exercises.pose_tuning import AdaptivePose
+
+
+class FakeGraph:
+    """Stands in for a MediaPipe Pose; each process() call advances the fake clock."""
+    def __init__(self, clock, model_complexity, latencies):
+        self.clock = clock
+        self.model_complexity = model_complexity
+        self.latencies = latencies  # Seconds per frame, by complexity
+        self.closed = False
+
+    def process(self, image):
+        self.clock["now"] += self.latencies[self.model_complexity]
+        return None
+
+    def reset(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_pose(monkeypatch):
+    clock = {"now": 0.0}
+    graphs = []
+    latencies = {2: 0.2, 1: 0.05, 0: 0.02}
+
+    def create_pose(model_complexity=1, **pose_kwargs):
+        if model_complexity not in latencies:
+            raise RuntimeError("model download failed")
+        graphs.append(FakeGraph(clock, model_complexity, latencies))
+        return graphs[-1]
+
+    monkeypatch.setattr(pose_tuning, "create_pose", create_pose)
+    monkeypatch.setattr(pose_tuning.time, "perf_counter", lambda: clock["now"])
+    return clock, graphs, latencies
+
+
+def test_warmup_frames_do_not_trigger_a_step_down(fake_pose):
+    clock, graphs, latencies = fake_pose
+    pose = AdaptivePose(1, target_fps=15, window=30, warmup=10)
+
+    # Graph start-up: the first frames are far over the 67 ms budget
+    latencies[1] = 0.5
+    for _ in range(10):
+        pose.process(None)
+    latencies[1] = 0.05
+    for _ in range(30):
+        pose.process(None)
+
+    assert pose.model_complexity == 1
+
+
+def test_siblings_step_down_together(fake_pose):
+    clock, graphs, latencies = fake_pose
+    pose = AdaptivePose(2, target_fps=15, window=30, warmup=0)
+    sibling = pose.sibling()
+
+    for _ in range(30):
+        pose.process(None)
+
+    assert (pose.model_complexity, sibling.model_complexity) == (1, 1)
+    assert pose.pose.model_complexity == sibling.pose.model_complexity == 1
+    assert all(graph.closed for graph in graphs[:2])
+
+
+def test_unavailable_lighter_model_keeps_the_current_one(fake_pose):
+    clock, graphs, latencies = fake_pose
+    del latencies[0]
+    latencies[1] = 0.5
+    pose = AdaptivePose(1, target_fps=15, window=30, warmup=0)
+
+    for _ in range(60):
+        pose.process(None)
+
+    assert pose.model_complexity == 1 and pose.model_complexity_floor == 1
+    assert len(graphs) == 1
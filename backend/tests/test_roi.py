@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+from exercises.roi import PoseROITracker
+
+FRAME = np.zeros((1080, 1920, 3), dtype=np.uint8)
+
+
+class FakePose:
+    """Returns a fixed skeleton, in the normalized coordinates of whatever image it is given."""
+    def __init__(self, box=None, stray=None):
+        self.box = box        # (x0, y0, x1, y1) of the person in full-frame pixels
+        self.stray = stray    # Optional (x, y) full-frame pixel of one low-visibility landmark
+        self.image_sizes = []
+        self.roi = None       # Set by the test to the crop the tracker uses
+
+    def process(self, image):
+        h, w = image.shape[:2]
+        self.image_sizes.append((w, h))
+        if self.box is None:
+            return SimpleNamespace(pose_landmarks=None)
+
+        # Image origin in frame pixels: the crop's corner, or (0, 0) for the full frame
+        ox, oy = (0, 0) if (w, h) == (FRAME.shape[1], FRAME.shape[0]) else self.roi[:2]
+        x0, y0, x1, y1 = self.box
+        points = [(x, y, 0.9) for x in (x0, x1) for y in (y0, y1)]
+        if self.stray:
+            points.append((*self.stray, 0.1))
+        landmarks = [SimpleNamespace(x=(x - ox) / w, y=(y - oy) / h, z=0.0, visibility=v) for x, y, v in points]
+        return SimpleNamespace(pose_landmarks=SimpleNamespace(landmark=landmarks))
+
+
+def _run(tracker, crop_pose, frames):
+    results = []
+    for _ in range(frames):
+        crop_pose.roi = tracker.roi
+        results.append(tracker.process(FRAME))
+    return results
+
+
+def test_small_person_is_tracked_in_a_stable_crop():
+    crop_pose, full_frame_pose = FakePose((800, 300, 1100, 860)), FakePose((800, 300, 1100, 860))
+    tracker = PoseROITracker(crop_pose, full_frame_pose)
+
+    results = _run(tracker, crop_pose, 20)
+
+    # One full-frame run to find the lifter, every later frame runs on the crop only
+    assert tracker.full_frame_runs == 1 and tracker.recrops == 0
+    assert len(crop_pose.image_sizes) == 19 and len(set(crop_pose.image_sizes)) == 1
+    assert crop_pose.image_sizes[0][0] * crop_pose.image_sizes[0][1] < 0.25 * 1920 * 1080
+    # Landmarks come back in full-frame coordinates
+    assert results[-1].pose_landmarks.landmark[0].x == pytest.approx(800 / 1920, abs=1e-3)
+
+
+def test_low_visibility_landmarks_outside_the_crop_do_not_recrop():
+    crop_pose = FakePose((800, 300, 1100, 860), stray=(200, 500))
+    full_frame_pose = FakePose((800, 300, 1100, 860))
+    tracker = PoseROITracker(crop_pose, full_frame_pose)
+
+    _run(tracker, crop_pose, 20)
+
+    assert tracker.full_frame_runs == 1 and tracker.recrops == 0
+
+
+def test_no_person_runs_only_the_full_frame_graph_once_per_frame():
+    crop_pose, full_frame_pose = FakePose(), FakePose()
+    tracker = PoseROITracker(crop_pose, full_frame_pose)
+
+    _run(tracker, crop_pose, 20)
+
+    assert len(full_frame_pose.image_sizes) == 20
+    assert crop_pose.image_sizes == []
+
+
+def test_person_filling_the_frame_skips_the_crop():
+    crop_pose, full_frame_pose = FakePose(), FakePose((300, 50, 1600, 1050))
+    tracker = PoseROITracker(crop_pose, full_frame_pose)
+
+    _run(tracker, crop_pose, 20)
+
+    assert tracker.roi is None
+    assert len(full_frame_pose.image_sizes) == 20 and crop_pose.image_sizes == []